@@ -14,11 +14,15 @@ Requires config.json (copy from config.example.json and fill in your keys).
 """
 
 import argparse
+import functools
 import json
 import os
+import random
+import re
 import sys
 import time
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
@@ -27,6 +31,11 @@ import requests
 import gspread
 from google.oauth2.service_account import Credentials
 
+try:
+    import orjson  # C-accelerated JSON; falls back to stdlib if absent
+except ImportError:
+    orjson = None
+
 
 # ---------------------------------------------------------------------------
 # Configuration
@@ -35,6 +44,12 @@ from google.oauth2.service_account import Credentials
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config.json")
 
+# One session for all Strava calls: the TLS handshake is paid once per
+# process, and the pool is sized to match the parallel page fetches.
+SESSION = requests.Session()
+SESSION.headers.update({"User-Agent": "strava-sync"})
+SESSION.mount("https://", requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
 
 def load_config():
     """Load configuration from config.json."""
@@ -48,7 +63,17 @@ def load_config():
 def save_config(config):
     """Save updated config (e.g. refreshed tokens) back to config.json."""
     with open(CONFIG_PATH, "w") as f:
-        json.dump(config, f, indent=2)
+        if orjson is not None:
+            f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2).decode())
+        else:
+            json.dump(config, f, indent=2)
+
+
+def parse_json(data):
+    """Decode a JSON byte string with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 # ---------------------------------------------------------------------------
@@ -60,6 +85,12 @@ class OAuthCallbackHandler(BaseHTTPRequestHandler):
     auth_code = None
 
     def do_GET(self):
+        # Browsers also request /favicon.ico etc.; don't let those
+        # stray hits satisfy the wait loop
+        if not self.path.startswith("/callback"):
+            self.send_response(404)
+            self.end_headers()
+            return
         query = parse_qs(urlparse(self.path).query)
         OAuthCallbackHandler.auth_code = query.get("code", [None])[0]
         self.send_response(200)
@@ -96,9 +127,12 @@ def strava_initial_auth(config):
     webbrowser.open(auth_url)
 
     server = HTTPServer(("localhost", 8089), OAuthCallbackHandler)
-    server.timeout = 120
+    server.timeout = 5
     print("   Waiting for authorization (timeout: 2 minutes)...")
-    server.handle_request()
+    deadline = time.time() + 120
+    while OAuthCallbackHandler.auth_code is None and time.time() < deadline:
+        server.handle_request()
+    server.server_close()
 
     code = OAuthCallbackHandler.auth_code
     if not code:
@@ -106,14 +140,14 @@ def strava_initial_auth(config):
         sys.exit(1)
 
     # Exchange code for tokens
-    resp = requests.post("https://www.strava.com/oauth/token", data={
+    resp = SESSION.post("https://www.strava.com/oauth/token", data={
         "client_id": client_id,
         "client_secret": client_secret,
         "code": code,
         "grant_type": "authorization_code",
     })
     resp.raise_for_status()
-    tokens = resp.json()
+    tokens = parse_json(resp.content)
 
     config["strava"]["access_token"] = tokens["access_token"]
     config["strava"]["refresh_token"] = tokens["refresh_token"]
@@ -123,26 +157,46 @@ def strava_initial_auth(config):
     print("✅ Strava authorization complete. Tokens saved to config.json.\n")
 
 
+# In-process token cache: {refresh_token: (access_token, expires_at)}.
+# Saves the config.json read/write dance when the token is still valid.
+_TOKEN_CACHE = {}
+
+# Refresh this many seconds before the token actually expires.
+_TOKEN_EXPIRY_BUFFER = 300
+
+
 def ensure_strava_token(config):
     """Refresh the Strava access token if it has expired."""
+    now = time.time()
+    refresh_token = config["strava"]["refresh_token"]
+
+    cached = _TOKEN_CACHE.get(refresh_token)
+    if cached and now < cached[1] - _TOKEN_EXPIRY_BUFFER:
+        return cached[0]
+
     expires_at = config["strava"].get("token_expires_at", 0)
-    if time.time() < expires_at - 60:
+    if now < expires_at - _TOKEN_EXPIRY_BUFFER:
+        _TOKEN_CACHE[refresh_token] = (config["strava"]["access_token"], expires_at)
         return config["strava"]["access_token"]
 
     print("   Refreshing Strava access token...")
-    resp = requests.post("https://www.strava.com/oauth/token", data={
+    resp = SESSION.post("https://www.strava.com/oauth/token", data={
         "client_id": config["strava"]["client_id"],
         "client_secret": config["strava"]["client_secret"],
         "grant_type": "refresh_token",
-        "refresh_token": config["strava"]["refresh_token"],
+        "refresh_token": refresh_token,
     })
     resp.raise_for_status()
-    tokens = resp.json()
+    tokens = parse_json(resp.content)
 
     config["strava"]["access_token"] = tokens["access_token"]
     config["strava"]["refresh_token"] = tokens["refresh_token"]
-    config["strava"]["token_expires_at"] = tokens["expires_at"]
-    save_config(config)
+    _TOKEN_CACHE[tokens["refresh_token"]] = (tokens["access_token"], tokens["expires_at"])
+
+    # Only touch disk when something actually changed
+    if config["strava"].get("token_expires_at") != tokens["expires_at"]:
+        config["strava"]["token_expires_at"] = tokens["expires_at"]
+        save_config(config)
 
     return tokens["access_token"]
 
@@ -151,74 +205,125 @@ def ensure_strava_token(config):
 # Strava API — Fetch Activities
 # ---------------------------------------------------------------------------
 
-def fetch_activities(access_token, after_timestamp, activity_type="Run"):
+_PAGE_FETCH_WORKERS = 4
+
+# The only summary-activity fields the rest of the pipeline reads; the
+# full Strava dicts carry ~50 more we'd otherwise hold for every page
+_ACTIVITY_FIELDS = ("type", "name", "distance", "moving_time",
+                    "start_date", "start_date_local")
+
+
+def _fetch_activity_page(access_token, after_timestamp, page, per_page):
+    """Fetch a single page of activities from Strava."""
+    resp = SESSION.get(
+        "https://www.strava.com/api/v3/athlete/activities",
+        headers={"Authorization": f"Bearer {access_token}"},
+        params={"after": int(after_timestamp), "page": page, "per_page": per_page},
+    )
+    resp.raise_for_status()
+    return parse_json(resp.content)
+
+
+def fetch_activities(access_token, after_timestamp, activity_type="Run", limit=None):
     """
     Fetch activities from Strava after a given Unix timestamp.
+    Page 1 is fetched up front; if it comes back full, further pages are
+    fetched speculatively in parallel until a short page appears.
+    Non-matching activity types are dropped per page and the survivors
+    are projected down to _ACTIVITY_FIELDS, so memory scales with the
+    run count rather than total activities times full payload size. An
+    optional limit stops pagination early once enough matches have
+    accumulated.
     Returns a list of activity dicts filtered to runs (by default).
     """
-    activities = []
-    page = 1
     per_page = 50
 
-    while True:
-        resp = requests.get(
-            "https://www.strava.com/api/v3/athlete/activities",
-            headers={"Authorization": f"Bearer {access_token}"},
-            params={"after": int(after_timestamp), "page": page, "per_page": per_page},
-        )
-        resp.raise_for_status()
-        batch = resp.json()
-        if not batch:
-            break
-        activities.extend(batch)
-        if len(batch) < per_page:
-            break
-        page += 1
-
-    # Filter to the desired type
-    if activity_type:
-        activities = [a for a in activities if a.get("type") == activity_type]
+    def keep(batch):
+        return [
+            {k: a[k] for k in _ACTIVITY_FIELDS if k in a}
+            for a in batch
+            if not activity_type or a.get("type") == activity_type
+        ]
+
+    batch = _fetch_activity_page(access_token, after_timestamp, 1, per_page)
+    activities = keep(batch)
+
+    if len(batch) == per_page and (limit is None or len(activities) < limit):
+        next_page = 2
+        done = False
+        with ThreadPoolExecutor(max_workers=_PAGE_FETCH_WORKERS) as executor:
+            while not done:
+                pages = range(next_page, next_page + _PAGE_FETCH_WORKERS)
+                batches = executor.map(
+                    lambda p: _fetch_activity_page(access_token, after_timestamp, p, per_page),
+                    pages,
+                )
+                for batch in batches:
+                    activities.extend(keep(batch))
+                    if len(batch) < per_page or (limit is not None and len(activities) >= limit):
+                        done = True
+                        break
+                next_page += _PAGE_FETCH_WORKERS
+
+    if limit is not None:
+        activities = activities[:limit]
 
     return activities
 
 
+# Strava reports distance in meters; multiply by these instead of dividing
+_INV_METERS_PER_MILE = 1.0 / 1609.344
+_INV_METERS_PER_KM = 1e-3
+
+if sys.version_info >= (3, 11):
+    _parse_iso = datetime.fromisoformat  # handles the trailing "Z" natively
+else:
+    def _parse_iso(s):
+        return datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+
+def format_pace(moving_time_s, distance):
+    """Format minutes-per-unit pace as M:SS, or N/A for zero distance."""
+    if distance <= 0:
+        return "N/A"
+    pace_min, pace_sec = divmod(int(moving_time_s / distance), 60)
+    return f"{pace_min}:{pace_sec:02d}"
+
+
+def format_duration(total_seconds):
+    """Format seconds as H:MM:SS, or M:SS under an hour."""
+    mins, secs = divmod(int(total_seconds), 60)
+    hours, mins = divmod(mins, 60)
+    if hours:
+        return f"{hours}:{mins:02d}:{secs:02d}"
+    return f"{mins}:{secs:02d}"
+
+
 def parse_activity(activity, units="miles"):
     """
     Extract the fields we care about from a Strava activity dict.
     Returns a dict with: date, distance, pace, duration, name.
     """
+    factor = _INV_METERS_PER_MILE if units == "miles" else _INV_METERS_PER_KM
+    return _parse_activity(activity, factor)
+
+
+def _parse_activity(activity, factor):
+    """parse_activity with the meters conversion factor already resolved."""
     # Distance: Strava returns meters
-    distance_m = activity["distance"]
-    if units == "miles":
-        distance = distance_m / 1609.344
-        unit_label = "mi"
-    else:
-        distance = distance_m / 1000.0
-        unit_label = "km"
+    distance = activity["distance"] * factor
 
-    # Pace: minutes per unit
     moving_time_s = activity["moving_time"]
-    if distance > 0:
-        pace_total_seconds = moving_time_s / distance
-        pace_min = int(pace_total_seconds // 60)
-        pace_sec = int(pace_total_seconds % 60)
-        pace_str = f"{pace_min}:{pace_sec:02d}"
-    else:
-        pace_str = "N/A"
+    pace_str = format_pace(moving_time_s, distance)
+    duration_str = format_duration(moving_time_s)
 
-    # Duration as HH:MM:SS
-    hours = moving_time_s // 3600
-    mins = (moving_time_s % 3600) // 60
-    secs = moving_time_s % 60
-    if hours:
-        duration_str = f"{int(hours)}:{int(mins):02d}:{int(secs):02d}"
-    else:
-        duration_str = f"{int(mins)}:{int(secs):02d}"
-
-    # Date (local to the activity)
+    # Date (local to the activity): Strava sends ISO-8601, so the date is
+    # just the first ten characters — no datetime parse needed
     start_local = activity.get("start_date_local", activity["start_date"])
-    dt = datetime.fromisoformat(start_local.replace("Z", "+00:00"))
-    date_str = dt.strftime("%Y-%m-%d")
+    if len(start_local) >= 10 and start_local[4] == "-":
+        date_str = start_local[:10]
+    else:
+        date_str = _parse_iso(start_local).strftime("%Y-%m-%d")
 
     return {
         "date": date_str,
@@ -231,6 +336,18 @@ def parse_activity(activity, units="miles"):
     }
 
 
+def parse_activities(activities, units="miles"):
+    """
+    Parse a batch of Strava activities in one pass, sorted by date.
+    The unit conversion factor is resolved once for the whole batch
+    instead of per activity.
+    """
+    factor = _INV_METERS_PER_MILE if units == "miles" else _INV_METERS_PER_KM
+    parsed = [_parse_activity(a, factor) for a in activities]
+    parsed.sort(key=lambda x: x["date"])
+    return parsed
+
+
 def combine_same_day(activities_parsed):
     """
     Combine multiple activities on the same day into a single entry.
@@ -251,29 +368,11 @@ def combine_same_day(activities_parsed):
         total_distance_raw = sum(a["distance_raw"] for a in acts)
         total_time_s = sum(a["moving_time_s"] for a in acts)
 
-        # Distance-weighted pace
-        if total_distance_raw > 0:
-            pace_total_seconds = total_time_s / total_distance_raw
-            pace_min = int(pace_total_seconds // 60)
-            pace_sec = int(pace_total_seconds % 60)
-            pace_str = f"{pace_min}:{pace_sec:02d}"
-        else:
-            pace_str = "N/A"
-
-        # Duration
-        hours = total_time_s // 3600
-        mins = (total_time_s % 3600) // 60
-        secs = total_time_s % 60
-        if hours:
-            duration_str = f"{int(hours)}:{int(mins):02d}:{int(secs):02d}"
-        else:
-            duration_str = f"{int(mins)}:{int(secs):02d}"
-
         combined.append({
             "date": date,
             "distance": round(total_distance_raw, 2),
-            "pace": pace_str,
-            "duration": duration_str,
+            "pace": format_pace(total_time_s, total_distance_raw),  # distance-weighted
+            "duration": format_duration(total_time_s),
             "name": " + ".join(a["name"] for a in acts if a["name"]),
             "distance_raw": total_distance_raw,
             "moving_time_s": total_time_s,
@@ -286,53 +385,198 @@ def combine_same_day(activities_parsed):
 # Google Sheets — Write Data
 # ---------------------------------------------------------------------------
 
-def open_sheet(config):
-    """Authenticate with Google and open the target spreadsheet."""
+# Statuses worth retrying: quota exhaustion and transient server errors
+_RETRY_STATUSES = (429, 500, 503)
+_MAX_RETRIES = 5
+
+
+def retry_on_quota(func):
+    """
+    Retry a Sheets call that fails with 429/500/503, backing off
+    exponentially with jitter (honoring Retry-After when present).
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                return func(*args, **kwargs)
+            except gspread.exceptions.APIError as exc:
+                status = exc.response.status_code
+                if status not in _RETRY_STATUSES or attempt == _MAX_RETRIES:
+                    raise
+                retry_after = exc.response.headers.get("Retry-After")
+                if retry_after:
+                    delay = float(retry_after)
+                else:
+                    delay = min(2 ** attempt, 60) + random.uniform(0, 1)
+                print(f"   ⏳ Sheets API returned {status}; retrying in {delay:.1f}s...")
+                time.sleep(delay)
+    return wrapper
+
+
+@retry_on_quota
+def _values_batch_get(spreadsheet, ranges, params=None):
+    return spreadsheet.values_batch_get(ranges=ranges, params=params)
+
+
+@retry_on_quota
+def _values_batch_update(spreadsheet, body):
+    return spreadsheet.values_batch_update(body)
+
+
+@retry_on_quota
+def _find_in_column(worksheet, value, col):
+    return worksheet.find(value, in_column=col)
+
+
+@functools.lru_cache(maxsize=4)
+def _open_sheet_cached(service_account_json, spreadsheet_id):
+    """Authenticate once per (credentials, spreadsheet) pair and cache the handle."""
     scopes = [
         "https://www.googleapis.com/auth/spreadsheets",
         "https://www.googleapis.com/auth/drive.readonly",
     ]
     creds = Credentials.from_service_account_file(
-        config["google"]["service_account_json"],
+        service_account_json,
         scopes=scopes,
     )
     gc = gspread.authorize(creds)
-
-    spreadsheet_id = config["google"]["spreadsheet_id"]
     return gc.open_by_key(spreadsheet_id)
 
 
-def find_date_row(worksheet, date_str, date_col):
+def open_sheet(config):
+    """Authenticate with Google and open the target spreadsheet."""
+    return _open_sheet_cached(
+        config["google"]["service_account_json"],
+        config["google"]["spreadsheet_id"],
+    )
+
+
+# Sheets serial dates count days from this epoch
+_SHEETS_EPOCH = datetime(1899, 12, 30)
+
+
+def build_date_index(spreadsheet, sheet_name, date_col):
     """
-    Find the row number in the worksheet where the date column matches date_str.
-    Returns the row number (1-indexed) or None if not found.
+    Fetch the date column once and map normalized dates to row numbers.
+    Returns a {YYYY-MM-DD: row_number} dict (1-indexed rows).
+
+    Uses the values.batchGet endpoint so additional columns can be added
+    to the same request later without extra round-trips. Values are
+    requested unformatted: date-typed cells come back as serial day
+    numbers and convert with integer math, so only cells holding literal
+    text go through normalize_date at all.
     """
-    date_values = worksheet.col_values(date_col)
-    for i, val in enumerate(date_values, start=1):
-        # Normalize the date format for comparison
-        normalized = normalize_date(val)
-        if normalized == date_str:
-            return i
-    return None
+    col_letter = gspread.utils.rowcol_to_a1(1, date_col)[:-1]
+    result = _values_batch_get(
+        spreadsheet,
+        ranges=[f"'{sheet_name}'!{col_letter}:{col_letter}"],
+        params={"valueRenderOption": "UNFORMATTED_VALUE"},
+    )
+    rows = result["valueRanges"][0].get("values", [])
+    index = {}
+    for i, row in enumerate(rows, start=1):
+        val = row[0] if row else None
+        if isinstance(val, (int, float)):
+            normalized = (_SHEETS_EPOCH + timedelta(days=int(val))).strftime("%Y-%m-%d")
+        else:
+            normalized = normalize_date(val)
+        if normalized and normalized not in index:
+            index[normalized] = i
+    return index
+
+
+# One pass over the supported formats: YYYY-MM-DD, M/D/Y(Y), "March 5, 2024"
+_DATE_RE = re.compile(
+    r"^(?:(\d{4})-(\d{1,2})-(\d{1,2})"
+    r"|(\d{1,2})/(\d{1,2})/(\d{2,4})"
+    r"|([A-Za-z]+)\s+(\d{1,2}),\s*(\d{4}))$"
+)
+
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+                "August", "September", "October", "November", "December")
+_MONTHS = {name.lower(): i for i, name in enumerate(_MONTH_NAMES, start=1)}
+_MONTHS.update({name[:3].lower(): i for i, name in enumerate(_MONTH_NAMES, start=1)})
 
 
 def normalize_date(val):
     """Try to parse various date formats into YYYY-MM-DD."""
     if not val:
         return None
-    for fmt in ("%Y-%m-%d", "%m/%d/%Y", "%m/%d/%y", "%d/%m/%Y", "%B %d, %Y", "%b %d, %Y"):
-        try:
-            return datetime.strptime(val.strip(), fmt).strftime("%Y-%m-%d")
-        except ValueError:
-            continue
-    return val.strip()
+    val = val.strip()
+    m = _DATE_RE.match(val)
+    if not m:
+        return val
+    g = m.groups()
+    try:
+        if g[0]:  # YYYY-MM-DD
+            y, mo, d = int(g[0]), int(g[1]), int(g[2])
+        elif g[3]:  # slash date: month/day first, day/month when month > 12
+            a, b, y = int(g[3]), int(g[4]), int(g[5])
+            if y < 100:
+                y += 2000 if y < 69 else 1900  # strptime's %y pivot
+            mo, d = (a, b) if a <= 12 else (b, a)
+        else:  # "March 5, 2024" / "Mar 5, 2024"
+            mo = _MONTHS.get(g[6].lower())
+            if mo is None:
+                return val
+            d, y = int(g[7]), int(g[8])
+        datetime(y, mo, d)  # validate ranges
+    except ValueError:
+        return val
+    return f"{y:04d}-{mo:02d}-{d:02d}"
+
+
+def _values_equal(new, existing):
+    """Compare a values grid against what the API returned (all strings)."""
+    if len(new) != len(existing):
+        return False
+    for new_row, old_row in zip(new, existing):
+        if len(new_row) != len(old_row):
+            return False
+        if any(str(a) != str(b) for a, b in zip(new_row, old_row)):
+            return False
+    return True
+
+
+def _contiguous_segments(cells):
+    """
+    Split sorted (column, value) pairs into runs of adjacent columns.
+    Yields (start_column, [values]) so each run becomes one A1 range.
+    """
+    segments = []
+    for col, val in cells:
+        if segments and col == segments[-1][0] + len(segments[-1][1]):
+            segments[-1][1].append(val)
+        else:
+            segments.append((col, [val]))
+    return segments
+
+
+def prefetch_sheet(config):
+    """
+    Open the target worksheet and build its date index.
+    Runs in a background thread from main so the Sheets auth and column
+    read overlap with Strava pagination; the result feeds update_sheet.
+    """
+    mapping = config["sheet_mapping"]
+    sheet_name = mapping.get("sheet_name", "Sheet1")
+    spreadsheet = open_sheet(config)
+    worksheet = spreadsheet.worksheet(sheet_name)
+    date_index = build_date_index(spreadsheet, sheet_name, mapping["date_column"])
+    return spreadsheet, worksheet, date_index
 
 
-def update_sheet(config, activities_parsed):
+def update_sheet(config, activities_parsed, prefetched=None):
     """
     Write parsed activity data into the Google Sheet.
     Matches rows by date and writes distance + pace into the configured columns.
+    Pass the result of prefetch_sheet as `prefetched` to skip re-reading
+    the worksheet and date column.
     """
+    if not activities_parsed:
+        return 0, []
+
     mapping = config["sheet_mapping"]
     sheet_name = mapping.get("sheet_name", "Sheet1")
     date_col = mapping["date_column"]             # e.g. 1 for column A
@@ -341,32 +585,68 @@ def update_sheet(config, activities_parsed):
     duration_col = mapping.get("duration_column") # optional
     notes_col = mapping.get("notes_column")       # optional — writes activity name
 
-    spreadsheet = open_sheet(config)
-    worksheet = spreadsheet.worksheet(sheet_name)
+    if prefetched is not None:
+        spreadsheet, worksheet, date_index = prefetched
+    else:
+        spreadsheet = open_sheet(config)
+        worksheet = spreadsheet.worksheet(sheet_name)
+        date_index = None
+        if len(activities_parsed) == 1:
+            # Server-side search: one cell back instead of the whole column.
+            # A miss may just mean the sheet formats dates differently, so
+            # fall through to the full index in that case.
+            cell = _find_in_column(worksheet, activities_parsed[0]["date"], date_col)
+            if cell is not None:
+                date_index = {activities_parsed[0]["date"]: cell.row}
+        if date_index is None:
+            # One read for the whole date column instead of one per activity
+            date_index = build_date_index(spreadsheet, sheet_name, date_col)
 
     updates = 0
     skipped = []
+    data = []
 
     for act in activities_parsed:
-        row = find_date_row(worksheet, act["date"], date_col)
+        row = date_index.get(act["date"])
         if row is None:
             skipped.append(act["date"])
             continue
 
-        # Build batch of cells to update
-        cells_to_update = [
-            gspread.Cell(row, distance_col, act["distance"]),
-            gspread.Cell(row, pace_col, act["pace"]),
-        ]
+        # Accumulate {range, values} entries for one values.batchUpdate call
+        cells = [(distance_col, act["distance"]), (pace_col, act["pace"])]
         if duration_col:
-            cells_to_update.append(gspread.Cell(row, duration_col, act["duration"]))
+            cells.append((duration_col, act["duration"]))
         if notes_col and act["name"]:
-            cells_to_update.append(gspread.Cell(row, notes_col, act["name"]))
+            cells.append((notes_col, act["name"]))
+        cells.sort()
+        for start_col, values in _contiguous_segments(cells):
+            start_a1 = gspread.utils.rowcol_to_a1(row, start_col)
+            end_a1 = gspread.utils.rowcol_to_a1(row, start_col + len(values) - 1)
+            data.append({
+                "range": f"'{sheet_name}'!{start_a1}:{end_a1}",
+                "values": [values],
+            })
 
-        worksheet.update_cells(cells_to_update, value_input_option='USER_ENTERED')
         updates += 1
         print(f"   ✅ {act['date']}: {act['distance']} — {act['pace']}")
 
+    if data:
+        # Diff against what the sheet already holds and rewrite only the
+        # ranges that changed — repeat runs become zero write requests
+        current = _values_batch_get(spreadsheet, ranges=[d["range"] for d in data])
+        data = [
+            entry for entry, vr in zip(data, current["valueRanges"])
+            if not _values_equal(entry["values"], vr.get("values", [[]]))
+        ]
+
+    if data:
+        _values_batch_update(spreadsheet, {
+            "valueInputOption": "USER_ENTERED",
+            "data": data,
+        })
+    elif updates:
+        print("   (All matched rows already up to date — nothing written)")
+
     return updates, skipped
 
 
@@ -398,6 +678,14 @@ def main():
         sys.exit(1)
 
     # --- Fetch ---
+    # The Sheets side needs no Strava token, so start its auth +
+    # date-column read first and let it overlap the token refresh and
+    # the Strava pagination below
+    sheet_future = None
+    if not args.dry_run:
+        prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        sheet_future = prefetch_pool.submit(prefetch_sheet, config)
+
     access_token = ensure_strava_token(config)
     after = datetime.now(timezone.utc) - timedelta(days=args.days)
     after_ts = after.timestamp()
@@ -410,9 +698,7 @@ def main():
         return
 
     units = config.get("units", "miles")
-    parsed = [parse_activity(a, units=units) for a in activities]
-    parsed.sort(key=lambda x: x["date"])
-    parsed = combine_same_day(parsed)
+    parsed = combine_same_day(parse_activities(activities, units=units))
 
     print(f"   Found {len(parsed)} run(s):\n")
     for p in parsed:
@@ -424,7 +710,7 @@ def main():
 
     # --- Write ---
     print(f"\n📊 Writing to Google Sheets...")
-    updates, skipped = update_sheet(config, parsed)
+    updates, skipped = update_sheet(config, parsed, prefetched=sheet_future.result())
 
     print(f"\n✅ Done! Updated {updates} row(s).")
     if skipped: